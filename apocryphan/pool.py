@@ -14,12 +14,11 @@ connections are opened and closed when you are finished with them, so they can b
 returned to the pool.
 """
 
-import heapq
 import random
 import time
 import threading
 
-from collections import namedtuple
+from collections import deque
 
 try:
     from psycopg2.extensions import TRANSACTION_STATUS_IDLE
@@ -43,9 +42,16 @@ class MaxConnectionsExceeded(ValueError):
     pass
 
 
-PoolConnection = namedtuple(
-    "PoolConnection", ("timestamp", "connection", "checked_out", "cursor")
-)
+class PoolConnection:
+    __slots__ = ("timestamp", "connection", "checked_out", "cursor", "prepared")
+
+    def __init__(self, timestamp, connection, checked_out, cursor, prepared):
+        self.timestamp = timestamp
+        self.connection = connection
+        self.checked_out = checked_out
+        self.cursor = cursor
+        # Names of statements prepared on this connection
+        self.prepared = prepared
 
 
 class PooledDatabase(object):
@@ -59,8 +65,15 @@ class PooledDatabase(object):
         if self._wait_timeout == 0:
             self._wait_timeout = float("inf")
 
-        # Available / idle connections stored in a heap, sorted oldest first.
-        self._connections = []
+        # Available / idle connections stored in a stack, the most recently
+        # returned connection is checked out first so it stays warm.
+        self._connections = deque()
+
+        # Guards `_connections` between threads checking out and returning
+        # connections. Stale idle connections are swept at most once per
+        # `stale_timeout`.
+        self._lock = threading.RLock()
+        self._next_sweep = 0
 
         # Mapping of connection id to PoolConnection. Ordinarily we would want
         # to use something like a WeakKeyDictionary, but Python typically won't
@@ -97,30 +110,39 @@ class PooledDatabase(object):
         )
 
     def _connect(self):
-        while True:
-            try:
-                # Remove the oldest connection from the heap.
-                ts, conn = heapq.heappop(self._connections)
-            except IndexError:
-                ts = conn = None
-                break
-            else:
-                if self._is_closed(conn):
-                    # This connecton was closed, but since it was not stale
-                    # it got added back to the queue of available conns. We
-                    # then closed it and marked it as explicitly closed, so
-                    # it's safe to throw it away now.
-                    # (Because Database.close() calls Database._close()).
-                    ts = conn = None
-                elif self._stale_timeout and self._is_stale(ts):
-                    # If we are attempting to check out a stale connection,
-                    # then close it. We don't need to mark it in the "closed"
-                    # set, because it is not in the list of available conns
-                    # anymore.
-                    self._close(conn, True)
+        now = time.time()
+        stale = []
+
+        with self._lock:
+            if self._stale_timeout and now >= self._next_sweep:
+                stale.extend(self._pop_stale_idle(now))
+                self._next_sweep = now + self._stale_timeout
+
+            while True:
+                try:
+                    # Take the most recently returned connection.
+                    ts, conn, prepared = self._connections.pop()
+                except IndexError:
                     ts = conn = None
-                else:
                     break
+                else:
+                    if self._is_closed(conn):
+                        # This connecton was closed, but since it was not stale
+                        # it got added back to the queue of available conns. We
+                        # then closed it and marked it as explicitly closed, so
+                        # it's safe to throw it away now.
+                        # (Because Database.close() calls Database._close()).
+                        ts = conn = None
+                    elif self._stale_timeout and self._is_stale(ts, now):
+                        # If we are attempting to check out a stale connection,
+                        # then close it (outside the lock, below).
+                        stale.append(conn)
+                        ts = conn = None
+                    else:
+                        break
+
+        for c in stale:
+            c.close()
 
         if conn is None:
             if self._max_connections and (len(self._in_use) >= self._max_connections):
@@ -128,9 +150,10 @@ class PooledDatabase(object):
 
             conn = super(PooledDatabase, self)._connect()
             ts = time.time() - random.random() / 1000
+            prepared = set()
 
         self._in_use[self.conn_key] = PoolConnection(
-            ts, conn, time.time(), conn.cursor()
+            ts, conn, time.time(), conn.cursor(), prepared
         )
 
         return conn
@@ -138,7 +161,7 @@ class PooledDatabase(object):
     def _new_cursor(self):
         c = self._in_use[self.conn_key]
         self._in_use[self.conn_key] = PoolConnection(
-            c.timestamp, c.connection, c.checked_out, c.connection.cursor()
+            c.timestamp, c.connection, c.checked_out, c.connection.cursor(), c.prepared
         )
 
     @property
@@ -146,10 +169,30 @@ class PooledDatabase(object):
         c = self._in_use[self.conn_key]
         return c.cursor
 
-    def _is_stale(self, timestamp):
+    def _prepared_names(self):
+        # Prepared statements belong to the connection, so they're kept with
+        # it in the pool and dropped when it is closed
+        c = self._in_use.get(self.conn_key)
+        return c.prepared if c is not None else set()
+
+    def _pop_stale_idle(self, now):
+        # Connections at the bottom of the stack may never get popped, so
+        # trim stale ones from that end. Must be called holding `_lock`.
+        stale = []
+
+        while self._connections and self._is_stale(self._connections[0][0], now):
+            stale.append(self._connections.popleft()[1])
+
+        return stale
+
+    def _is_stale(self, timestamp, now=None):
         # Called on check-out and check-in to ensure the connection has
-        # not outlived the stale timeout.
-        return (time.time() - timestamp) > self._stale_timeout
+        # not outlived the stale timeout. Pass `now` when checking several
+        # connections so the clock is only read once.
+        if now is None:
+            now = time.time()
+
+        return (now - timestamp) > self._stale_timeout
 
     def _is_closed(self, conn):
         return False
@@ -169,7 +212,10 @@ class PooledDatabase(object):
             if self._stale_timeout and self._is_stale(pool_conn.timestamp):
                 super(PooledDatabase, self)._close(conn)
             elif self._can_reuse(conn):
-                heapq.heappush(self._connections, (pool_conn.timestamp, conn))
+                with self._lock:
+                    self._connections.append(
+                        (pool_conn.timestamp, conn, pool_conn.prepared)
+                    )
 
     def manual_close(self):
         # Close the underlying connection without returning it to the pool.
@@ -189,26 +235,26 @@ class PooledDatabase(object):
     def close_idle(self):
         # Close any open connections that are not currently in-use.
         with self._lock:
-            for _, conn in self._connections:
+            for _, conn, _ in self._connections:
                 self._close(conn, close_conn=True)
-            self._connections = []
+            self._connections.clear()
 
     def close_stale(self, age=600):
         # Close any connections that are in-use but were checked out quite some
         # time ago and can be considered stale.
         with self._lock:
-            in_use = {}
             cutoff = time.time() - age
-            n = 0
-            for key, pool_conn in self._in_use.items():
-                if pool_conn.checked_out < cutoff:
-                    self._close(pool_conn.connection, close_conn=True)
-                    n += 1
-                else:
-                    in_use[key] = pool_conn
-            self._in_use = in_use
+            stale = [c for c in self._in_use.values() if c.checked_out < cutoff]
+
+            for pool_conn in stale:
+                self._close(pool_conn.connection, close_conn=True)
+
+            if stale:
+                self._in_use = {
+                    k: c for k, c in self._in_use.items() if c.checked_out >= cutoff
+                }
 
-        return n
+        return len(stale)
 
     def close_all(self):
         # Close all connections -- available and in-use. Warning: may break any
@@ -216,11 +262,11 @@ class PooledDatabase(object):
         self.close()
 
         with self._lock:
-            for _, conn in self._connections:
+            for _, conn, _ in self._connections:
                 self._close(conn, close_conn=True)
             for pool_conn in self._in_use.values():
                 self._close(pool_conn.connection, close_conn=True)
-            self._connections = []
+            self._connections.clear()
             self._in_use = {}
 
 
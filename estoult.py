@@ -1,6 +1,8 @@
 from copy import deepcopy
 from collections import namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, count
 
 try:
     import sqlite3
@@ -9,17 +11,20 @@ except ImportError:
 
 try:
     import psycopg2
+    import psycopg2.extras
 except ImportError:
     psycopg2 = None
 
 try:
     import MySQLdb as mysql
+    import MySQLdb.cursors
 except ImportError:
     mysql = None
 
 
 __version__ = "0.4.4"
 __all__ = [
+    "Bind",
     "Clause",
     "ClauseError",
     "Database",
@@ -29,6 +34,7 @@ __all__ = [
     "FieldError",
     "fn",
     "op",
+    "PreparedQuery",
     "Query",
     "QueryError",
 ]
@@ -64,28 +70,40 @@ _sql_ops = {
 }
 
 
+@lru_cache(maxsize=128)
+def _placeholders(n):
+    return ", ".join(["%s"] * n)
+
+
+class _NativeSQL(str):
+    # SQL that already uses the database's placeholder, so it doesn't have
+    # to be rewritten on every execute
+    pass
+
+
+def _native_sql(sql, placeholder):
+    if placeholder == "%s":
+        return sql
+
+    return _NativeSQL(sql.replace("%s", placeholder))
+
+
 def _parse_arg(arg):
     if isinstance(arg, Clause):
-        return arg
+        return arg.clause, arg.params
     elif isinstance(arg, Field):
-        return str(arg), ()
+        return arg._full_name, ()
     elif isinstance(arg, Query):
         return arg._query, arg._params
-    elif isinstance(arg, list) or isinstance(arg, tuple):
-        placeholders = ", ".join(["%s"] * len(arg))
-        return placeholders, tuple(arg)
+    elif isinstance(arg, (list, tuple)):
+        return _placeholders(len(arg)), tuple(arg)
 
     return "%s", (arg,)
 
 
-def _parse_args(func):
-    def wrapper(*args):
-        return func(*[_parse_arg(a) for a in args])
-
-    return wrapper
-
-
 def _strip(string):
+    # No longer used internally, builders join their parts without trailing
+    # separators. Kept for code that still calls it.
     string = string.rstrip(" ,")
 
     if string.endswith("and"):
@@ -95,16 +113,50 @@ def _strip(string):
 
 
 def _make_op(operator):
-    @_parse_args
     def wrapper(lhs, rhs):
-        return Clause(f"({lhs[0]}) {operator} ({rhs[0]})", tuple(lhs[1] + rhs[1]))
+        ls, lp = _parse_arg(lhs)
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"({ls}) {operator} ({rs})", lp + rp)
+
+    return wrapper
+
+
+# Operator overloads for `Clause` and `Field`. The left hand side is always
+# an instance of the class so it doesn't need to go through `_parse_arg`.
+
+
+def _make_clause_op(operator):
+    def wrapper(self, rhs):
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"({self.clause}) {operator} ({rs})", self.params + rp)
+
+    return wrapper
+
+
+def _make_field_op(operator):
+    def wrapper(self, rhs):
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"({self._full_name}) {operator} ({rs})", rp)
 
     return wrapper
 
 
 def _make_fn(name):
+    # Calls on a single field like `fn.count(Frog.id)` always give the same
+    # clause, so keep them by the field's name
+    fields = {}
+
     def wrapper(*args):
-        return Clause(f"{name}({str(', '.join([str(a) for a in args]))})", ())
+        if len(args) == 1 and isinstance(args[0], Field):
+            key = args[0]._full_name
+            clause = fields.get(key)
+
+            if clause is None:
+                clause = fields[key] = Clause(f"{name}({key})", ())
+
+            return clause
+
+        return Clause(f"{name}({', '.join(map(str, args))})", ())
 
     return wrapper
 
@@ -113,17 +165,31 @@ class ClauseMetaclass(type):
     def __new__(cls, clsname, bases, attrs):
         # Add op overloading
         for name, operator in _sql_ops.items():
-            attrs[f"__{name}__"] = _make_op(operator)
+            attrs[f"__{name}__"] = _make_clause_op(operator)
 
         return super(ClauseMetaclass, cls).__new__(cls, clsname, bases, attrs)
 
 
-class Clause(namedtuple("Clause", ["clause", "params"]), metaclass=ClauseMetaclass):
+class Clause(metaclass=ClauseMetaclass):
+    __slots__ = ("clause", "params")
+
+    def __init__(self, clause, params):
+        self.clause = clause
+        self.params = params
+
+    def __iter__(self):
+        # Allows unpacking with `string, params = clause`
+        yield self.clause
+        yield self.params
+
+    def __repr__(self):
+        return f"Clause(clause={self.clause!r}, params={self.params!r})"
+
     def __str__(self):
         return self.clause
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self.clause)
 
     def __eq__(self, comp):
         return str(self) == comp
@@ -147,49 +213,55 @@ class op(metaclass=OperatorMetaclass):
         setattr(cls, name, staticmethod(func))
 
     @staticmethod
-    @_parse_args
     def or_(lhs, rhs):
-        return Clause(f"(({_strip(lhs[0])}) or ({_strip(rhs[0])}))", (lhs[1] + rhs[1]))
+        ls, lp = _parse_arg(lhs)
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"(({ls}) or ({rs}))", lp + rp)
 
     @staticmethod
-    @_parse_args
     def and_(lhs, rhs):
-        return Clause(f"(({_strip(lhs[0])}) and ({_strip(rhs[0])}))", (lhs[1] + rhs[1]))
+        ls, lp = _parse_arg(lhs)
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"(({ls}) and ({rs}))", lp + rp)
 
     @staticmethod
-    @_parse_args
     def in_(lhs, rhs):
-        return Clause(f"(({_strip(lhs[0])}) in ({_strip(rhs[0])}))", (lhs[1] + rhs[1]))
+        ls, lp = _parse_arg(lhs)
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"(({ls}) in ({rs}))", lp + rp)
 
     @staticmethod
-    @_parse_args
     def like(lhs, rhs):
-        return Clause(f"({lhs[0]}) like ({rhs[0]})", (lhs[1] + rhs[1]))
+        ls, lp = _parse_arg(lhs)
+        rs, rp = _parse_arg(rhs)
+        return Clause(f"({ls}) like ({rs})", lp + rp)
 
     @staticmethod
-    @_parse_args
     def ilike(lhs, rhs):
+        ls, lp = _parse_arg(lhs)
+        rs, rp = _parse_arg(rhs)
+
         # Does a case insensitive `like`. Only postgres has this operator,
         # but we can hack it together for the others
         if psycopg2:
-            return Clause(f"({lhs[0]}) ilike ({rhs[0]})", (lhs[1] + rhs[1]))
+            return Clause(f"({ls}) ilike ({rs})", lp + rp)
 
-        return Clause(f"lower({lhs[0]}) like lower({rhs[0]})", (lhs[1] + rhs[1]))
+        return Clause(f"lower({ls}) like lower({rs})", lp + rp)
 
     @staticmethod
-    @_parse_args
     def not_(arg):
-        return Clause(f"not ({arg[0]})", (arg[1]))
+        s, p = _parse_arg(arg)
+        return Clause(f"not ({s})", p)
 
     @staticmethod
-    @_parse_args
     def is_null(arg):
-        return Clause(f"({arg[0]}) is null", (arg[1]))
+        s, p = _parse_arg(arg)
+        return Clause(f"({s}) is null", p)
 
     @staticmethod
-    @_parse_args
     def not_null(arg):
-        return Clause(f"({arg[0]}) is not null", (arg[1]))
+        s, p = _parse_arg(arg)
+        return Clause(f"({s}) is not null", p)
 
 
 class FunctionMetaclass(type):
@@ -238,7 +310,7 @@ class FieldMetaclass(type):
     def __new__(cls, clsname, bases, attrs):
         # Add op overloading
         for name, operator in _sql_ops.items():
-            attrs[f"__{name}__"] = _make_op(operator)
+            attrs[f"__{name}__"] = _make_field_op(operator)
 
         return super(FieldMetaclass, cls).__new__(cls, clsname, bases, attrs)
 
@@ -254,23 +326,34 @@ class Field(metaclass=FieldMetaclass):
         self.default = kwargs.get("default")
         self.primary_key = kwargs.get("primary_key") is True
 
+    def clone(self):
+        # Fields only hold plain attributes so a shallow copy is enough
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        return new
+
     @property
     def full_name(self):
-        return f"{self.schema.__tablename__}.{self.name}"
+        return self._full_name
 
     def __str__(self):
-        return self.full_name
+        return self._full_name
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
     def __eq__(self, comp):
         return str(self) == comp
 
 
+def _field_keys(row):
+    # Allow you to use a Field as key
+    return {(k.name if isinstance(k, Field) else k): v for k, v in row.items()}
+
+
 class SchemaMetaclass(type):
     def __new__(cls, clsname, bases, attrs):
-        # Deepcopy inherited fields
+        # Copy inherited fields
         for base in bases:
             at = dir(base)
 
@@ -278,39 +361,65 @@ class SchemaMetaclass(type):
                 f = getattr(base, a)
 
                 if isinstance(f, Field):
-                    attrs[a] = deepcopy(f)
+                    attrs[a] = f.clone()
+
+        # Build the field table once so lookups don't have to walk `dir`
+        fields = tuple(attrs[k] for k in sorted(attrs) if isinstance(attrs[k], Field))
+        pk = None
+
+        for i, field in enumerate(fields):
+            if field.primary_key is True:
+                pk = i
+                break
+
+            if field.name == "id":
+                pk = i
+
+        attrs["_fields_tuple"] = fields
+        attrs["_field_names"] = tuple(f.name for f in fields)
+        attrs["_field_types"] = tuple(f.type for f in fields)
+        attrs["_field_casters"] = tuple(f.caster for f in fields)
+        attrs["_field_defaults"] = tuple(f.default for f in fields)
+        attrs["_field_nulls"] = tuple(f.null for f in fields)
+        attrs["_pk_index"] = pk
+        attrs["_pk_name"] = fields[pk].name if pk is not None else None
 
         c = super(SchemaMetaclass, cls).__new__(cls, clsname, bases, attrs)
 
         # Add schema to fields
-        for key in dir(c):
-            f = getattr(c, key)
+        for f in fields:
+            f.schema = c
 
-            if isinstance(f, Field):
-                f.schema = c
+        c._set_full_names()
 
         return c
 
+    def _set_full_names(cls):
+        for f in cls._fields_tuple:
+            f._full_name = f"{cls.__tablename__}.{f.name}"
+            f._hash = hash(f._full_name)
+
+        # Subclasses might be using our `__tablename__`
+        for sub in cls.__subclasses__():
+            sub._set_full_names()
+
+    def __setattr__(cls, name, value):
+        super(SchemaMetaclass, cls).__setattr__(name, value)
+
+        # The table name can be changed after the class is made (Rider does)
+        if name == "__tablename__":
+            cls._set_full_names()
+
     @property
     def fields(cls):
-        return [
-            getattr(cls, key)
-            for key in dir(cls)
-            if isinstance(getattr(cls, key), Field)
-        ]
+        return list(cls._fields_tuple)
 
     @property
     def pk(cls):
-        pk = None
-
-        for field in cls.fields:
-            if field.primary_key is True:
-                return field
-
-            if field.name == "id":
-                pk = field
+        if cls._pk_index is None:
+            return None
 
-        return pk
+        return cls._fields_tuple[cls._pk_index]
 
     def __getitem__(cls, item):
         return getattr(cls, item)
@@ -321,59 +430,66 @@ class Schema(metaclass=SchemaMetaclass):
     _database_ = None
     __tablename__ = None
 
-    @classmethod
-    def _cast(cls, updating, row):
-        # Allow you to use a Field as key
-        for key, value in list(row.items()):
-            if isinstance(key, Field):
-                row[key.name] = value
-            else:
-                row[key] = value
-
-        changeset = {}
-
-        for field in cls.fields:
-            value = None
-
-            if field.default is not None:
-                value = field.default
-
-            try:
-                value = row[field.name]
-            except KeyError:
-                if updating is True or field.name == cls.pk.name:
-                    continue
-
-            if value is not None:
-                value = (
-                    field.type(value) if field.caster is None else field.caster(value)
-                )
+    # Compiled SQL for `insert`, `update` and `delete`, keyed by the kind of
+    # statement, schema, table name, placeholder and the column names used.
+    # The SQL is stored with the database's placeholder already in place.
+    _sql_cache = {}
 
-            changeset[field.name] = value
+    @classmethod
+    def _clear_sql_cache(cls):
+        for key in [k for k in Schema._sql_cache if k[1] is cls or cls is Schema]:
+            del Schema._sql_cache[key]
 
-        return changeset
+    @classmethod
+    def _cast(cls, updating, row):
+        return cls._casval(updating, row, validate=False)
 
     @classmethod
     def _validate(cls, updating, row):
+        return cls._casval(updating, row, cast=False)
+
+    @classmethod
+    def _casval(cls, updating, row, cast=True, validate=True):
+        # Casts and validates the row in a single pass over the fields
+        row = _field_keys(row)
         changeset = {}
 
-        for field in cls.fields:
-            try:
-                value = row[field.name]
-            except KeyError:
-                continue
+        for i, name in enumerate(cls._field_names):
+            if cast is True:
+                value = cls._field_defaults[i]
+
+                try:
+                    value = row[name]
+                except KeyError:
+                    if updating is True or name == cls._pk_name:
+                        continue
+
+                if value is not None:
+                    caster = cls._field_casters[i]
+                    value = (
+                        cls._field_types[i](value) if caster is None else caster(value)
+                    )
+            else:
+                try:
+                    value = row[name]
+                except KeyError:
+                    continue
 
-            if field.null is False and value is None and updating is True:
-                raise FieldError(f"{str(field)} cannot be None")
+            if (
+                validate is True
+                and value is None
+                and updating is True
+                and cls._field_nulls[i] is False
+            ):
+                raise FieldError(f"{str(cls._fields_tuple[i])} cannot be None")
 
-            changeset[field.name] = value
+            changeset[name] = value
 
         return changeset
 
     @classmethod
     def casval(cls, row, updating):
-        changeset = cls._cast(updating, row)
-        changeset = cls._validate(updating, changeset)
+        changeset = cls._casval(updating, row)
 
         # A user specified validation function
         validate_func = getattr(cls, "validate", lambda x: x)
@@ -385,39 +501,79 @@ class Schema(metaclass=SchemaMetaclass):
     def insert(cls, obj):
         changeset = cls.casval(obj, updating=False)
 
-        params = list(changeset.values())
-        fields = ", ".join(changeset.keys())
-        placeholders = ", ".join(["%s"] * len(changeset))
+        ph = cls._database_.placeholder
+        key = ("insert", cls, cls.__tablename__, ph, tuple(changeset.keys()))
+        sql = Schema._sql_cache.get(key)
 
-        sql = f"insert into {cls.__tablename__} (%s) values (%s)\n" % (
-            fields,
-            placeholders,
-        )
+        if sql is None:
+            fields = ", ".join(changeset.keys())
+            placeholders = _placeholders(len(changeset))
 
-        if psycopg2 is not None:
-            sql += f"returning {cls.pk.name}\n"
+            sql = f"insert into {cls.__tablename__} ({fields}) values ({placeholders})"
+
+            if psycopg2 is not None:
+                sql = f"{sql} returning {cls.pk.name}"
+
+            sql = Schema._sql_cache[key] = _native_sql(sql, ph)
 
-        return cls._database_.insert(_strip(sql), params)
+        return cls._database_.insert(sql, list(changeset.values()))
+
+    @classmethod
+    def insert_many(cls, objs):
+        # Inserts all rows with a single statement
+        changesets = [cls.casval(obj, updating=False) for obj in objs]
+        postgres = isinstance(cls._database_, PostgreSQLDatabase)
+
+        if len(changesets) < 1:
+            # Same as what the database would return, ids or a row count
+            return [] if postgres else 0
+
+        keys = tuple(changesets[0].keys())
+
+        for changeset in changesets:
+            if tuple(changeset.keys()) != keys:
+                raise FieldError("All rows must have the same fields")
+
+        ph = cls._database_.placeholder
+        key = ("insert_many", cls, cls.__tablename__, ph, postgres, keys)
+        sql = Schema._sql_cache.get(key)
+
+        if sql is None:
+            fields = ", ".join(keys)
+
+            if postgres:
+                # `execute_values` expands the single placeholder into all rows
+                sql = f"insert into {cls.__tablename__} ({fields}) values %s"
+                sql = f"{sql} returning {cls.pk.name}"
+            else:
+                placeholders = _placeholders(len(keys))
+                sql = f"insert into {cls.__tablename__} ({fields})"
+                sql = f"{sql} values ({placeholders})"
+
+            sql = Schema._sql_cache[key] = _native_sql(sql, ph)
+
+        params = [tuple(changeset.values()) for changeset in changesets]
+        return cls._database_.insert_many(sql, params)
 
     @classmethod
     def update(cls, old, new):
         # This updates a single row only, if you want to update several
         # use `update` in `Query`
         changeset = cls.casval({**old, **new}, updating=True)
-        sql = f"update {cls.__tablename__} set "
-        params = []
 
-        for key, value in changeset.items():
-            sql += f"{key} = %s, "
-            params.append(value)
+        ph = cls._database_.placeholder
+        key = ("update", cls, cls.__tablename__, ph, tuple(changeset), tuple(old))
+        sql = Schema._sql_cache.get(key)
 
-        sql = f"{_strip(sql)} where "
+        if sql is None:
+            sets = ", ".join([f"{k} = %s" for k in changeset])
+            wheres = " and ".join([f"{k} = %s" for k in old])
+            sql = f"update {cls.__tablename__} set {sets} where {wheres}"
+            sql = Schema._sql_cache[key] = _native_sql(sql, ph)
 
-        for key, value in old.items():
-            sql += f"{key} = %s and "
-            params.append(value)
+        params = [*changeset.values(), *old.values()]
 
-        return cls._database_.sql(_strip(sql), params)
+        return cls._database_.sql(sql, params)
 
     @classmethod
     def update_by_pk(cls, id, new):
@@ -426,14 +582,16 @@ class Schema(metaclass=SchemaMetaclass):
     @classmethod
     def delete(cls, row):
         # Deletes single row - look at `Query` for batch
-        sql = f"delete from {cls.__tablename__} where "
-        params = []
+        ph = cls._database_.placeholder
+        key = ("delete", cls, cls.__tablename__, ph, tuple(row.keys()))
+        sql = Schema._sql_cache.get(key)
 
-        for key, value in row.items():
-            sql += f"{key} = %s and "
-            params.append(value)
+        if sql is None:
+            wheres = " and ".join([f"{k} = %s" for k in row])
+            sql = f"delete from {cls.__tablename__} where {wheres}"
+            sql = Schema._sql_cache[key] = _native_sql(sql, ph)
 
-        return cls._database_.sql(_strip(sql), params)
+        return cls._database_.sql(sql, list(row.values()))
 
     @classmethod
     def delete_by_pk(cls, id, new):
@@ -468,7 +626,25 @@ class QueryMetaclass(type):
         return super(QueryMetaclass, cls).__new__(cls, clsname, bases, attrs)
 
 
-Node = namedtuple("Node", ["node", "params"])
+class Node:
+    __slots__ = ("node", "params")
+
+    def __init__(self, node, params):
+        self.node = node
+        self.params = params
+
+    def __iter__(self):
+        yield self.node
+        yield self.params
+
+
+class Bind:
+    # A named parameter that is filled in when a prepared query is run
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"<Bind name={self.name}>"
 
 
 class Query(metaclass=QueryMetaclass):
@@ -476,39 +652,73 @@ class Query(metaclass=QueryMetaclass):
         self.schema = schema
 
         self._method = None
+        self._exec = None
+        self._exec_db = None
+        self._exec_method = None
         self._nodes = []
 
+        self._compiled_sql = None
+        self._compiled_params = None
+        self._native = {}
+
     def _add_node(self, node, params):
-        self._nodes.append(Node(_strip(node), params))
+        # Params are always stored as a tuple so they can be chained as is
+        if not isinstance(params, tuple):
+            params = tuple(params)
+
+        self._nodes.append(Node(node, params))
+
+        self._compiled_sql = None
+        self._compiled_params = None
+        self._native = {}
 
     @property
     def _query(self):
-        return " ".join([x.node for x in self._nodes])
+        if self._compiled_sql is None:
+            self._compiled_sql = " ".join(node for node, _ in self._nodes)
+
+        return self._compiled_sql
+
+    def _native_query(self, placeholder):
+        # `_query` rewritten for the database, kept per placeholder
+        sql = self._native.get(placeholder)
+
+        if sql is None:
+            sql = self._native[placeholder] = _native_sql(self._query, placeholder)
+
+        return sql
 
     @property
     def _params(self):
-        return tuple([p for x in self._nodes for p in x.params])
+        if self._compiled_params is None:
+            self._compiled_params = tuple(
+                chain.from_iterable(params for _, params in self._nodes)
+            )
+
+        return self._compiled_params
+
+    def compile(self):
+        return self._query, self._params
 
     def select(self, *args):
         self._method = "select"
 
-        query = ""
+        parts = []
         params = []
 
         if len(args) < 1:
-            query += "*"
+            parts.append("*")
         else:
             for arg in args:
                 if isinstance(arg, Clause):
                     string, p = arg
-                    query += f"{string}, "
+                    parts.append(string)
                     params.extend(p)
                 else:
-                    query += f"{arg}, "
+                    parts.append(str(arg))
 
-        self._add_node(
-            f"select {_strip(query)} from {self.schema.__tablename__}", params
-        )
+        query = ", ".join(parts)
+        self._add_node(f"select {query} from {self.schema.__tablename__}", params)
 
         return self
 
@@ -517,12 +727,8 @@ class Query(metaclass=QueryMetaclass):
 
         changeset = self.schema.casval(changeset, updating=True)
 
-        query = ""
-        params = []
-
-        for key, value in changeset.items():
-            query += f"{key} = %s, "
-            params.append(value)
+        query = ", ".join([f"{key} = %s" for key in changeset])
+        params = list(changeset.values())
 
         self._add_node(f"update {self.schema.__tablename__} set {query}", params)
 
@@ -548,16 +754,15 @@ class Query(metaclass=QueryMetaclass):
         return self
 
     def where(self, *clauses):
-        query = ""
+        parts = []
         params = []
 
         for clause in clauses:
             string, p = clause
-
-            # We can always add an `and` to the end cus it get stripped off ;)
-            query += f"{string} and "
+            parts.append(string)
             params.extend(p)
 
+        query = " and ".join(parts)
         self._add_node(f"where {query}", params)
 
         return self
@@ -565,7 +770,7 @@ class Query(metaclass=QueryMetaclass):
     def limit(self, *args):
         # Example: .limit(1) or limit(1, 2)
         if len(args) == 1:
-            self._add_node("limit %s", (args,))
+            self._add_node("limit %s", args)
         elif len(args) == 2:
             # `offset` works in mysql and postgres
             self._add_node("limit %s offset %s", args)
@@ -576,7 +781,7 @@ class Query(metaclass=QueryMetaclass):
 
     def order_by(self, *args):
         # Example: .order_by(Frog.id, {Frog.name: "desc"})
-        query = "order by "
+        parts = []
         params = []
 
         for a in args:
@@ -592,25 +797,41 @@ class Query(metaclass=QueryMetaclass):
 
             if isinstance(k, Clause):
                 c, p = _parse_arg(k)
-                query += "%s " % c
+                part = c
                 params.extend(p)
             else:
-                query += "%s "
+                part = "%s"
                 params.append(str(k))
 
-            if v:
-                query += f"{v}, "
+            parts.append(f"{part} {v}" if v else part)
 
-        self._add_node(f"{query}", params)
+        self._add_node(f"order by {', '.join(parts)}", params)
 
         return self
 
     def execute(self):
-        func = getattr(self.schema._database_, self._method)
-        return func(self._query, self._params)
+        # Keep the bound database function around for the next `execute`,
+        # looking it up again if the database or query type was changed
+        db = self.schema._database_
+
+        if (
+            self._exec is None
+            or self._exec_db is not db
+            or self._exec_method != self._method
+        ):
+            self._exec = getattr(db, self._method)
+            self._exec_db = db
+            self._exec_method = self._method
+
+        return self._exec(self._native_query(db.placeholder), self._params)
+
+    def prepared(self, name=None):
+        # Joins the query once, the returned object only fills in `Bind`s
+        return PreparedQuery(self, name)
 
     def copy(self):
-        return deepcopy(self)
+        # Share the cached database instead of copying it
+        return deepcopy(self, {id(self._exec_db): self._exec_db})
 
     def __str__(self):
         return self.schema._database_.mogrify(self._query, self._params).decode("utf-8")
@@ -619,14 +840,57 @@ class Query(metaclass=QueryMetaclass):
         return f'<Query query="{self._query}" params={self._params}>'
 
 
+class PreparedQuery:
+    def __init__(self, query, name=None):
+        self.schema = query.schema
+        self.method = query._method
+        self.sql, self.params = query.compile()
+        self.name = name or f"_est_{abs(hash((self.method, self.sql)))}"
+        self._native = {}
+
+    def native_sql(self, placeholder):
+        sql = self._native.get(placeholder)
+
+        if sql is None:
+            sql = self._native[placeholder] = _native_sql(self.sql, placeholder)
+
+        return sql
+
+    def __call__(self, **binds):
+        try:
+            params = tuple(
+                binds[x.name] if isinstance(x, Bind) else x for x in self.params
+            )
+        except KeyError as err:
+            raise QueryError(f"Missing value for bind {err}")
+
+        return self.schema._database_.run_prepared(self, params)
+
+    def __repr__(self):
+        return f'<PreparedQuery name="{self.name}" query="{self.sql}">'
+
+
 def _replace_placeholders(func):
     def wrapper(self, query, *args, **kwargs):
-        query = query.replace("%s", self.placeholder)
+        if self.placeholder != "%s" and not isinstance(query, _NativeSQL):
+            query = query.replace("%s", self.placeholder)
+
         return func(self, query, *args, **kwargs)
 
     return wrapper
 
 
+# Names for PostgreSQL server side cursors
+_stream_ids = count()
+
+
+@lru_cache(maxsize=256)
+def _row_type(cols):
+    # Column names like `count(id)` aren't valid identifiers, `rename` turns
+    # them into positional names
+    return namedtuple("Row", cols, rename=True)
+
+
 def _get_connection(func):
     def wrapper(self, *args, **kwargs):
         if self.autoconnect is True:
@@ -646,8 +910,9 @@ def _get_connection(func):
 
 
 class Database:
-    def __init__(self, autoconnect=True, *args, **kwargs):
+    def __init__(self, autoconnect=True, *args, dict_rows=True, **kwargs):
         self.autoconnect = autoconnect
+        self.dict_rows = dict_rows
 
         self.Schema = Schema
         self.Schema._database_ = self
@@ -659,8 +924,14 @@ class Database:
         self.cargs = args
         self.ckwargs = kwargs
 
+        # Names of the server side prepared statements on the current
+        # connection, see `PostgreSQLDatabase`
+        self._prepared = set()
+        self._prepared_gen = 0
+
     def connect(self):
         self._conn = self._connect()
+        self._prepared = set()
 
     def conn(self):
         return self._conn
@@ -669,6 +940,7 @@ class Database:
         self._conn.close()
 
     def close(self):
+        self._prepared = set()
         return self._close()
 
     def _new_cursor(self):
@@ -706,6 +978,13 @@ class Database:
         if self.is_trans is False:
             self.conn.commit()
 
+    @_replace_placeholders
+    def _execute_many(self, query, params):
+        self.cursor.executemany(query, params)
+
+        if self.is_trans is False:
+            self.conn.commit()
+
     @_get_connection
     def sql(self, query, params):
         return self._execute(query, params)
@@ -716,11 +995,57 @@ class Database:
             self._execute(query, params)
             return self.cursor._executed
 
+    def _make_rows(self, rows, cursor=None):
+        cursor = self.cursor if cursor is None else cursor
+        cols = tuple(col[0] for col in cursor.description)
+
+        if self.dict_rows is True:
+            return [dict(zip(cols, row)) for row in rows]
+
+        return list(map(_row_type(cols)._make, rows))
+
     @_get_connection
     def select(self, query, params):
         self._execute(query, params)
-        cols = [col[0] for col in self.cursor.description]
-        return [dict(zip(cols, row)) for row in self.cursor.fetchall()]
+        return self._make_rows(self.cursor.fetchall())
+
+    def _stream_cursor(self, conn, chunk_size):
+        # SQLite cursors already fetch rows as they are iterated
+        return conn.cursor()
+
+    @_replace_placeholders
+    def _execute_stream(self, query, params, conn, chunk_size):
+        cursor = self._stream_cursor(conn, chunk_size)
+        cursor.execute(query, params)
+        return cursor
+
+    def iter_select(self, query, params, chunk_size=1000):
+        # Like `select` but yields rows, fetching `chunk_size` at a time.
+        # With autoconnect the generator opens its own connection and keeps
+        # it in a local, so other queries run while iterating (which connect
+        # and close `self.conn`) don't touch it.
+        conn = self._connect() if self.autoconnect is True else self.conn
+
+        try:
+            cursor = self._execute_stream(query, params, conn, chunk_size)
+
+            try:
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+
+                    if len(rows) < 1:
+                        break
+
+                    yield from self._make_rows(rows, cursor)
+            finally:
+                # Also runs when the caller stops iterating early
+                cursor.close()
+
+                if self.is_trans is False:
+                    conn.commit()
+        finally:
+            if self.autoconnect is True:
+                conn.close()
 
     @_get_connection
     def insert(self, query, params):
@@ -731,6 +1056,25 @@ class Database:
 
         return self.cursor.lastrowid
 
+    @_get_connection
+    def insert_many(self, query, params):
+        self._execute_many(query, params)
+        return self.cursor.rowcount
+
+    def run_prepared(self, prepared, params):
+        # The drivers cache statements by their SQL, so reusing the joined
+        # string is all we can do here
+        sql = prepared.native_sql(self.placeholder)
+        return getattr(self, prepared.method)(sql, params)
+
+    def _prepared_names(self):
+        return self._prepared
+
+    def clear_prepared(self):
+        # Call after schema changes so prepared queries are planned again.
+        # Other connections drop their old statements when next used.
+        self._prepared_gen += 1
+
     def get(self, query, params):
         row = self.select(query, params)
         return row[0]
@@ -751,6 +1095,11 @@ class MySQLDatabase(Database):
     def _connect(self):
         return mysql.connect(*self.cargs, **self.ckwargs)
 
+    def _stream_cursor(self, conn, chunk_size):
+        # Unbuffered cursor, rows are read from the server as they're fetched.
+        # No other query can run on the connection until all rows are read.
+        return conn.cursor(MySQLdb.cursors.SSCursor)
+
 
 class PostgreSQLDatabase(Database):
     def __init__(self, *args, **kwargs):
@@ -765,6 +1114,61 @@ class PostgreSQLDatabase(Database):
     def mogrify(self, query, params):
         return self.cursor.mogrify(query, params)
 
+    def _stream_cursor(self, conn, chunk_size):
+        # Named cursors are kept on the server and fetched from in chunks.
+        # `withhold` keeps it valid if other queries commit in the meantime.
+        name = f"_est_stream_{next(_stream_ids)}"
+        cursor = conn.cursor(name=name, withhold=True)
+        cursor.itersize = chunk_size
+        return cursor
+
+    @_get_connection
+    def insert_many(self, query, params):
+        rows = psycopg2.extras.execute_values(self.cursor, query, params, fetch=True)
+
+        if self.is_trans is False:
+            self.conn.commit()
+
+        return [row[0] for row in rows]
+
+    def run_prepared(self, prepared, params):
+        # Prepared statements only live as long as the connection, there is
+        # nothing to reuse if every call opens a new one
+        if self.autoconnect is True:
+            return super().run_prepared(prepared, params)
+
+        suffix = f"_{self._prepared_gen}"
+        name = f"{prepared.name}{suffix}"
+        names = self._prepared_names()
+
+        if name not in names:
+            # Remove statements prepared before the last `clear_prepared`
+            for old in [n for n in names if not n.endswith(suffix)]:
+                self.cursor.execute(f"deallocate {old}")
+                names.discard(old)
+
+            # Postgres numbers its parameters, `%s` becomes `$1`, `$2`, ...
+            first, *rest = prepared.sql.split("%s")
+            sql = first + "".join(f"${i}{p}" for i, p in enumerate(rest, 1))
+            self.cursor.execute(f"prepare {name} as {sql}")
+            names.add(name)
+
+        if len(params) < 1:
+            query = f"execute {name}"
+        else:
+            query = f"execute {name} ({_placeholders(len(params))})"
+
+        return getattr(self, prepared.method)(query, params)
+
+    def clear_prepared(self):
+        super().clear_prepared()
+        names = self._prepared_names()
+
+        # Anything prepared means we're on an open connection
+        if len(names) > 0:
+            self.cursor.execute("deallocate all")
+            names.clear()
+
 
 class SQLiteDatabase(Database):
     def __init__(self, *args, **kwargs):